@@ -4,15 +4,18 @@ from flask import Flask
 from flask_cors import CORS
 from .config import DevelopmentConfig
 from .extensions import db, migrate
+from .utils import ORJSONProvider
 
 
 def create_app(config_object: type[DevelopmentConfig] = DevelopmentConfig) -> Flask:
     """Crea y configura la aplicacion utilizando application factory."""
     app = Flask(__name__)
     app.config.from_object(config_object)
+    app.json = ORJSONProvider(app)
 
     register_extensions(app)
     register_blueprints(app)
+    register_commands(app)
     CORS(app)
 
     return app
@@ -29,3 +32,10 @@ def register_blueprints(app: Flask) -> None:
     from .api import register_api_blueprints
 
     register_api_blueprints(app)
+
+
+def register_commands(app: Flask) -> None:
+    """Registra los comandos de consola (flask backfill-series, etc.)."""
+    from .commands import register_commands as register_cli_commands
+
+    register_cli_commands(app)
@@ -1,12 +1,14 @@
 """Endpoints de verificacion rapida de la API."""
 
-from flask import Blueprint, jsonify
+from flask import Blueprint
+
+from src.utils import ORJSONResponse
 
 bp = Blueprint("health", __name__, url_prefix="/health")
 
 
 @bp.get("/")
-def healthcheck() -> tuple[dict[str, str], int]:
+def healthcheck() -> ORJSONResponse:
     """Devuelve el estado actual de la aplicacion."""
     # TODO: agregar comprobaciones reales (db, cache, servicios externos).
-    return jsonify({"status": "ok"}), 200
+    return ORJSONResponse.make({"status": "ok"}, 200)
@@ -0,0 +1,20 @@
+"""Comandos de consola de la aplicacion (``flask <comando>``)."""
+
+import click
+from flask import Flask
+from flask.cli import with_appcontext
+
+from src.services import series as series_service
+
+
+@click.command("backfill-series")
+@with_appcontext
+def backfill_series_command() -> None:
+    """Recalcula los totales y la ultima temporada de las series existentes."""
+    updated = series_service.backfill_totals()
+    click.echo(f"Series actualizadas: {updated}")
+
+
+def register_commands(app: Flask) -> None:
+    """Registra los comandos de consola en ``app.cli``."""
+    app.cli.add_command(backfill_series_command)
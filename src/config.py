@@ -19,6 +19,13 @@ class BaseConfig:
         f"sqlite:///{INSTANCE_PATH / 'app.db'}",
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Pool de conexiones dimensionado para atender peticiones concurrentes.
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "20")),
+        "pool_pre_ping": True,
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+    }
     JSON_SORT_KEYS = False
 
 
@@ -33,6 +40,8 @@ class TestingConfig(BaseConfig):
 
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    # SQLite en memoria usa StaticPool, que no admite opciones de tamaño.
+    SQLALCHEMY_ENGINE_OPTIONS = {}
 
 
 class ProductionConfig(BaseConfig):
@@ -5,6 +5,22 @@ from .movie import Movie  # noqa: F401
 from .seasons import Season  # noqa: F401
 from .series import Series  # noqa: F401
 from .user import User  # noqa: F401
-from .watch_entry import WatchEntry  # noqa: F401
+from .watch_entry import (  # noqa: F401
+    ContentType,
+    Status,
+    WatchEntry,
+    WatchMovieEntry,
+    WatchSeriesEntry,
+)
 
-__all__ = ["Movie", "Season", "Series", "User", "WatchEntry"]
+__all__ = [
+    "ContentType",
+    "Movie",
+    "Season",
+    "Series",
+    "Status",
+    "User",
+    "WatchEntry",
+    "WatchMovieEntry",
+    "WatchSeriesEntry",
+]
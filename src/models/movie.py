@@ -2,30 +2,49 @@
 
 from __future__ import annotations
 
+import operator
 from datetime import datetime
 
 from src.extensions import db
 
 
+# Campos que expone Movie.to_dict, en el orden de la respuesta.
+_DICT_KEYS = (
+    "id",
+    "title",
+    "genre",
+    "release_year",
+    "created_at",
+    "updated_at",
+)
+_DICT_GETTER = operator.attrgetter(*_DICT_KEYS)
+
+
 class Movie(db.Model):
     """Representa una pelicula dentro del catalogo."""
 
     __tablename__ = "movies"
+    __table_args__ = (
+        # Indice cubriente para el listado: ordena por (title, id) y trae
+        # genre/release_year sin leer la tabla. Reemplaza al indice sobre title.
+        db.Index("ix_movies_title_cover", "title", "id", "release_year", "genre"),
+    )
 
     # TODO: definir columnas (id, title, genre, release_year, created_at, updated_at).
     id = db.Column(db.Integer, primary_key=True)
-    title = db.Column(db.String(120), nullable=False, index=True)
+    title = db.Column(db.String(120), nullable=False)
     genre = db.Column(db.String(50), nullable=True)
     release_year = db.Column(db.Integer, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Indexada: max(updated_at) y count(id) del ETag del listado salen del indice
     updated_at = db.Column(
-        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True
     )
 
     # TODO: crear relacion con WatchEntry (one-to-many) si aplica.
-    # Relacion polimorfica (via WatchEntry)
+    # Relacion polimorfica (via la subclase de WatchEntry)
     watch_entries = db.relationship(
-        "WatchEntry",
+        "WatchMovieEntry",
         back_populates="movie_content",
         cascade="all, delete-orphan",
     )
@@ -38,11 +57,4 @@ class Movie(db.Model):
     def to_dict(self) -> dict:
         """Serializa la instancia para respuestas JSON."""
         # TODO: reemplazar esta implementacion temporal por serializacion real.
-        return {
-            "id": self.id,
-            "title": self.title,
-            "genre": self.genre,
-            "release_year": self.release_year,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-        }
\ No newline at end of file
+        return dict(zip(_DICT_KEYS, _DICT_GETTER(self)))
\ No newline at end of file
@@ -2,9 +2,21 @@
 
 from __future__ import annotations
 
+import operator
+
 from src.extensions import db
 
 
+# Campos que expone Season.to_dict, en el orden de la respuesta.
+_DICT_KEYS = (
+    "id",
+    "series_id",
+    "number",
+    "episodes_count",
+)
+_DICT_GETTER = operator.attrgetter(*_DICT_KEYS)
+
+
 class Season(db.Model):
     """Temporada asociada a una serie."""
 
@@ -28,9 +40,4 @@ class Season(db.Model):
     def to_dict(self) -> dict:
         """Serializa la temporada en un diccionario."""
         # TODO: reemplazar esta implementacion por la serializacion real.
-        return {
-            "id": self.id,
-            "series_id": self.series_id,
-            "number": self.number,
-            "episodes_count": self.episodes_count,
-        }
\ No newline at end of file
+        return dict(zip(_DICT_KEYS, _DICT_GETTER(self)))
\ No newline at end of file
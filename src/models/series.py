@@ -2,11 +2,26 @@
 
 from __future__ import annotations
 
+import operator
 from datetime import datetime
 
 from src.extensions import db
 
 
+# Campos que expone Series.to_dict, en el orden de la respuesta.
+_DICT_KEYS = (
+    "id",
+    "title",
+    "total_seasons",
+    "synopsis",
+    "genres",
+    "image_url",
+    "created_at",
+    "updated_at",
+)
+_DICT_GETTER = operator.attrgetter(*_DICT_KEYS)
+
+
 class Series(db.Model):
     """Representa una serie cargada por los usuarios."""
 
@@ -16,9 +31,17 @@ class Series(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(120), nullable=False, index=True)
     total_seasons = db.Column(db.Integer, nullable=False, default=1)
+    # Suma de episodios de todas las temporadas, mantenida al agregar temporadas
+    total_episodes = db.Column(
+        db.Integer, nullable=False, default=0, server_default="0"
+    )
+    # Numero y episodios de la temporada mas alta, mantenidos al agregar temporadas
+    last_season_number = db.Column(db.Integer, nullable=True)
+    last_season_episode_count = db.Column(db.Integer, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Indexada: max(updated_at) y count(id) del ETag del listado salen del indice
     updated_at = db.Column(
-        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True
     )
     # TODO: agregar columnas opcionales (synopsis, genres, image_url) si se desean.
     synopsis = db.Column(db.Text, nullable=True)
@@ -29,12 +52,12 @@ class Series(db.Model):
     seasons = db.relationship(
         "Season",
         back_populates="series",
-        lazy="joined",
+        lazy="select",
         cascade="all, delete-orphan",
     )
-    # Relacion polimorfica (via WatchEntry)
+    # Relacion polimorfica (via la subclase de WatchEntry)
     watch_entries = db.relationship(
-        "WatchEntry",
+        "WatchSeriesEntry",
         back_populates="series_content",
         cascade="all, delete-orphan",
     )
@@ -46,16 +69,7 @@ class Series(db.Model):
     def to_dict(self, include_seasons: bool = False) -> dict:
         """Serializa la serie y opcionalmente sus temporadas."""
         # TODO: reemplazar por serializacion real usando marshmallow o similar.
-        data = {
-            "id": self.id,
-            "title": self.title,
-            "total_seasons": self.total_seasons,
-            "synopsis": self.synopsis,
-            "genres": self.genres,
-            "image_url": self.image_url,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-        }
+        data = dict(zip(_DICT_KEYS, _DICT_GETTER(self)))
         if include_seasons:
             # TODO: serializar temporadas reales en lugar de lista vacia.
             data["seasons"] = [season.to_dict() for season in self.seasons]
@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+import operator
 from datetime import datetime
 
 from src.extensions import db
 
 
+# Campos que expone User.to_dict, en el orden de la respuesta.
+_DICT_KEYS = (
+    "id",
+    "name",
+    "email",
+    "created_at",
+)
+_DICT_GETTER = operator.attrgetter(*_DICT_KEYS)
+
+
 class User(db.Model):
     """Representa a un usuario (simulado mediante el header X-User-Id)."""
 
@@ -30,9 +41,4 @@ class User(db.Model):
     def to_dict(self) -> dict:
         """Serializa al usuario para respuestas JSON."""
         # TODO: reemplazar esta implementacion por serializacion real.
-        return {
-            "id": self.id,
-            "name": self.name,
-            "email": self.email,
-            "created_at": self.created_at,
-        }
\ No newline at end of file
+        return dict(zip(_DICT_KEYS, _DICT_GETTER(self)))
\ No newline at end of file
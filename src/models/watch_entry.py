@@ -2,9 +2,71 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import enum
+from datetime import datetime, timezone
 
 from src.extensions import db
+from src.models.series import Series
+
+
+def _utcnow() -> datetime:
+    """Instante actual en UTC, con zona horaria."""
+    return datetime.now(timezone.utc)
+
+
+class ContentType(str, enum.Enum):
+    """Tipos de contenido que admite la watchlist."""
+
+    movie = "movie"
+    series = "series"
+
+
+class Status(str, enum.Enum):
+    """Estados posibles de una entrada de la watchlist."""
+
+    pending = "pending"
+    watching = "watching"
+    watched = "watched"
+
+
+# Valores fijos de una entrada vista: no hace falta leerlos de la instancia
+# (ni recargar la columna generada si expiro tras un flush).
+_WATCHED_TEMPLATE = {"status": Status.watched, "percentage_watched": 100.0}
+
+
+def _build_serializer(fields: tuple[str, ...], doc: str):
+    """Genera ``WatchEntry.to_dict``, que arma el dict de ``fields`` sin getattr.
+
+    Las columnas cargadas se leen directo del __dict__ de la instancia; si
+    alguna expiro (p. ej. tras un commit) se recarga con un acceso normal.
+    Las entradas vistas toman de ``_WATCHED_TEMPLATE`` los valores fijos.
+    """
+
+    def read(field: str) -> str:
+        return f"state[{field!r}] if {field!r} in state else self.{field}"
+
+    items = ", ".join(f"{field!r}: {read(field)}" for field in fields)
+    watched_items = ", ".join(
+        f"{field!r}: _TEMPLATE[{field!r}]"
+        if field in _WATCHED_TEMPLATE
+        else f"{field!r}: {read(field)}"
+        for field in fields
+    )
+    source = (
+        "def to_dict(self):\n"
+        "    state = self.__dict__\n"
+        "    if state.get('status') is _WATCHED:\n"
+        f"        return {{{watched_items}}}\n"
+        f"    return {{{items}}}\n"
+    )
+    namespace: dict = {"_TEMPLATE": _WATCHED_TEMPLATE, "_WATCHED": Status.watched}
+    # Nombre de archivo propio para que las trazas no apunten a <string>
+    exec(compile(source, f"<{__name__}.WatchEntry.to_dict>", "exec"), namespace)
+    function = namespace["to_dict"]
+    function.__qualname__ = "WatchEntry.to_dict"
+    function.__module__ = __name__
+    function.__doc__ = doc
+    return function
 
 
 class WatchEntry(db.Model):
@@ -18,103 +80,245 @@ class WatchEntry(db.Model):
             "content_id",
             name="uq_user_content",
         ),
+        db.CheckConstraint(
+            "content_type IN ('movie', 'series')", name="ck_watch_content_type"
+        ),
+        # Invariantes de progreso: la columna generada confia en ellas
+        db.CheckConstraint(
+            "watched_episodes IS NULL OR total_episodes IS NULL"
+            " OR watched_episodes <= total_episodes",
+            name="ck_watched_leq_total",
+        ),
+        db.CheckConstraint(
+            "watched_episodes >= 0 AND total_episodes >= 0",
+            name="ck_nonneg_progress",
+        ),
+        # Filtrado de la watchlist por estado (p. ej. "watching") por usuario
+        db.Index("ix_watch_entries_user_status", "user_id", "status"),
+        # Orden por recencia de /me/watchlist; incluye id por el cursor (updated_at, id)
+        db.Index("ix_watch_entries_user_updated", "user_id", "updated_at", "id"),
+    )
+
+    # Herencia de tabla unica: content_type decide la subclase de cada fila.
+    # Solo quita las ramas por content_type del codigo; ambas columnas FK siguen
+    # en watch_entries y la que no corresponde al tipo queda en NULL.
+    # No se usan tablas por subclase porque _insert_entry (services/progress)
+    # crea la entrada con un unico INSERT ... RETURNING de Core, que escribe
+    # una sola tabla: con herencia por tablas unidas haria falta un segundo
+    # INSERT con el id devuelto.
+    __mapper_args__ = {"polymorphic_on": "content_type", "polymorphic_abstract": True}
+
+    # Columnas expuestas por to_dict, en el orden de la respuesta
+    __json_fields__ = (
+        "id",
+        "user_id",
+        "content_type",
+        "content_id",
+        "status",
+        "current_season",
+        "current_episode",
+        "watched_episodes",
+        "total_episodes",
+        "percentage_watched",
+        "updated_at",
+    )
+    # Columnas del listado /me/watchlist: sin la posicion actual (columnas diferidas)
+    __json_light_fields__ = tuple(
+        field
+        for field in __json_fields__
+        if field not in ("current_season", "current_episode")
     )
 
     # TODO: definir columnas basicas (id, user_id, content_type, content_id, status).
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
-    # 'movie' o 'series'
-    content_type = db.Column(db.String(20), nullable=False)
+    # Enums nativos en Postgres; en SQLite se guardan como VARCHAR corto
+    content_type = db.Column(
+        db.Enum(ContentType, native_enum=True, name="watch_content_type"),
+        nullable=False,
+    )
     content_id = db.Column(db.Integer, nullable=False)
-    # 'pending', 'watching', 'watched'
-    status = db.Column(db.String(20), nullable=False, default="pending")
+    status = db.Column(
+        db.Enum(Status, native_enum=True, name="watch_status"),
+        nullable=False,
+        default=Status.pending,
+    )
 
     # TODO: agregar columnas de progreso (current_season, current_episode, watched_episodes, total_episodes).
-    current_season = db.Column(db.Integer, nullable=True, default=1)
-    current_episode = db.Column(db.Integer, nullable=True, default=1)
-    watched_episodes = db.Column(db.Integer, nullable=True, default=0)
-    total_episodes = db.Column(db.Integer, nullable=True, default=0)
+    # Contadores en SMALLINT: ninguna serie llega a 32767 temporadas o episodios.
+    # Solo se cargan al acceder a ellas (o con undefer_group("progress_detail"))
+    current_season = db.deferred(
+        db.Column(db.SmallInteger, nullable=True, default=1), group="progress_detail"
+    )
+    current_episode = db.deferred(
+        db.Column(db.SmallInteger, nullable=True, default=1), group="progress_detail"
+    )
+    watched_episodes = db.Column(db.SmallInteger, nullable=True, default=0)
+    total_episodes = db.Column(db.SmallInteger, nullable=True, default=0)
+    # Porcentaje de avance calculado por la base de datos (columna generada).
+    # El contenido completado cuenta como 100; ck_watched_leq_total garantiza
+    # que los vistos no superan el total, asi que no hace falta limitarlos.
+    # Se calcula en centesimas con division entera (trunca a 2 decimales).
+    percentage_watched = db.Column(
+        db.Float,
+        db.Computed(
+            "CASE WHEN status = 'watched' THEN 100.0"
+            " WHEN COALESCE(total_episodes, 0) = 0 THEN 0.0"
+            " ELSE (COALESCE(watched_episodes, 0) * 10000 / total_episodes) / 100.0"
+            " END",
+            persisted=True,
+        ),
+    )
 
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(
+        db.DateTime(timezone=True), nullable=False, server_default=db.func.now()
+    )
+    # updated_at es la clave del cursor de /me/watchlist: se estampa desde Python
+    # con microsegundos, porque CURRENT_TIMESTAMP en SQLite solo guarda segundos
+    # y se compara como texto contra el cursor. El onupdate tambien aplica a los
+    # UPDATE de Core (bulk_mark_watched).
     updated_at = db.Column(
-        db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        db.DateTime(timezone=True),
+        nullable=False,
+        default=_utcnow,
+        onupdate=_utcnow,
     )
 
-    # TODO: establecer claves foraneas hacia User, Movie y Series segun el tipo.
-    # Se usan relaciones polimorficas "condicionales"
-    movie_content_id = db.Column(db.Integer, db.ForeignKey("movies.id"), nullable=True)
-    series_content_id = db.Column(db.Integer, db.ForeignKey("series.id"), nullable=True)
-
     # TODO: modelar las relaciones back_populates con User, Movie y Series.
+    # Las claves foraneas hacia Movie y Series se mapean en cada subclase.
     user = db.relationship("User", back_populates="watch_entries")
 
-    movie_content = db.relationship(
-        "Movie",
-        foreign_keys=[movie_content_id],
-        back_populates="watch_entries",
-    )
-    series_content = db.relationship(
-        "Series",
-        foreign_keys=[series_content_id],
-        back_populates="watch_entries",
+    def mark_as_watched(self) -> None:
+        """Marca el contenido como completado."""
+        # TODO: actualizar atributos y timestamps para reflejar el estado final.
+        # Cada subclase completa los episodios y la posicion final.
+        self.status = Status.watched
+
+    @classmethod
+    def bulk_mark_watched(cls, user_id: int, entry_ids: list[int]) -> int:
+        """Marca varias entradas como vistas con un unico UPDATE.
+
+        Equivale a llamar ``mark_as_watched`` en cada entrada, pero sin cargarlas:
+        para series la ultima temporada se lee de Series con subconsultas
+        correlacionadas.
+        No hace commit; devuelve la cantidad de filas actualizadas.
+        """
+        series = db.select(Series).where(
+            Series.id == WatchSeriesEntry.series_content_id
+        )
+        is_series_with_episodes = db.and_(
+            cls.content_type == ContentType.series, cls.total_episodes > 0
+        )
+        stmt = (
+            db.update(cls)
+            .where(cls.user_id == user_id, cls.id.in_(entry_ids))
+            .values(
+                status=Status.watched,
+                watched_episodes=db.func.coalesce(
+                    cls.total_episodes, cls.watched_episodes
+                ),
+                current_season=db.case(
+                    (
+                        is_series_with_episodes,
+                        db.func.coalesce(
+                            series.with_only_columns(
+                                Series.last_season_number
+                            ).scalar_subquery(),
+                            cls.current_season,
+                        ),
+                    ),
+                    else_=cls.current_season,
+                ),
+                current_episode=db.case(
+                    (
+                        is_series_with_episodes,
+                        db.func.coalesce(
+                            series.with_only_columns(
+                                Series.last_season_episode_count
+                            ).scalar_subquery(),
+                            cls.current_episode,
+                        ),
+                    ),
+                    else_=cls.current_episode,
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return db.session.execute(stmt).rowcount
+
+    # TODO: reemplazar con serializacion acorde al modelo final.
+    to_dict = _build_serializer(
+        __json_fields__, "Serializa la entrada para respuestas JSON."
     )
 
-    def __init__(self, *args, **kwargs):
-        """Asigna content_id a la clave foranea correcta."""
-        super().__init__(*args, **kwargs)
-        if self.content_type == "movie":
-            self.movie_content_id = self.content_id
+
+class WatchMovieEntry(WatchEntry):
+    """Entrada de la watchlist para una pelicula."""
+
+    __mapper_args__ = {"polymorphic_identity": ContentType.movie}
+
+    movie_content_id = db.Column(db.Integer, db.ForeignKey("movies.id"), nullable=True)
+    movie_content = db.relationship("Movie", back_populates="watch_entries")
+
+    @classmethod
+    def initial_values(cls, user_id: int, content_id: int) -> dict:
+        """Columnas de una entrada nueva de pelicula, listas para el INSERT."""
+        return {
+            "user_id": user_id,
+            "content_type": ContentType.movie,
+            "content_id": content_id,
+            "movie_content_id": content_id,
+            "status": Status.pending,
             # Para peliculas, los episodios son 1
-            self.total_episodes = 1
-            self.watched_episodes = 0
-        elif self.content_type == "series":
-            self.series_content_id = self.content_id
-            # total_episodes deberia calcularse al agregar la serie
-
-    def percentage_watched(self) -> float:
-        """Calcula el porcentaje completado para el contenido asociado."""
-        # TODO: implementar calculo utilizando watched_episodes y total_episodes.
-        if self.status == "watched":
-            return 100.0
-        if not self.total_episodes or self.total_episodes == 0:
-            return 0.0
-        
-        # Asegurar que los vistos no superen el total
-        watched = min(self.watched_episodes or 0, self.total_episodes)
-        
-        percentage = (watched / self.total_episodes) * 100
-        return round(percentage, 2)
+            "total_episodes": 1,
+            "watched_episodes": 0,
+        }
 
     def mark_as_watched(self) -> None:
-        """Marca el contenido como completado."""
-        # TODO: actualizar atributos y timestamps para reflejar el estado final.
-        self.status = "watched"
-        if self.content_type == "movie":
-            self.watched_episodes = 1
-        elif self.content_type == "series" and self.total_episodes:
-            self.watched_episodes = self.total_episodes
-            if self.series_content and self.series_content.seasons:
-                # Opcional: setear a la ultima temporada/episodio
-                last_season = max(s.number for s in self.series_content.seasons)
-                self.current_season = last_season
-                self.current_episode = next(
-                    s.episodes_count for s in self.series_content.seasons if s.number == last_season
-                )
-        self.updated_at = datetime.utcnow()
-
-    def to_dict(self) -> dict:
-        """Serializa la entrada para respuestas JSON."""
-        # TODO: reemplazar con serializacion acorde al modelo final.
+        """Marca la pelicula como vista."""
+        super().mark_as_watched()
+        self.watched_episodes = 1
+
+
+class WatchSeriesEntry(WatchEntry):
+    """Entrada de la watchlist para una serie."""
+
+    __mapper_args__ = {"polymorphic_identity": ContentType.series}
+
+    series_content_id = db.Column(
+        db.Integer, db.ForeignKey("series.id"), nullable=True
+    )
+    # lazy="raise": quien llame a mark_as_watched debe cargarla de antemano
+    # (selectinload) para no disparar consultas N+1 al marcar entradas.
+    series_content = db.relationship(
+        "Series", back_populates="watch_entries", lazy="raise"
+    )
+
+    @classmethod
+    def initial_values(
+        cls, user_id: int, content_id: int, total_episodes: int
+    ) -> dict:
+        """Columnas de una entrada nueva de serie, listas para el INSERT."""
         return {
-            "id": self.id,
-            "user_id": self.user_id,
-            "content_type": self.content_type,
-            "content_id": self.content_id,
-            "status": self.status,
-            "current_season": self.current_season,
-            "current_episode": self.current_episode,
-            "watched_episodes": self.watched_episodes,
-            "total_episodes": self.total_episodes,
-            "percentage_watched": self.percentage_watched(),
-            "updated_at": self.updated_at,
-        }
\ No newline at end of file
+            "user_id": user_id,
+            "content_type": ContentType.series,
+            "content_id": content_id,
+            "series_content_id": content_id,
+            "status": Status.pending,
+            "total_episodes": total_episodes,
+            "watched_episodes": 0,
+            "current_season": 1,
+            "current_episode": 1,
+        }
+
+    def mark_as_watched(self) -> None:
+        """Marca la serie como vista y posiciona la ultima temporada."""
+        super().mark_as_watched()
+        if not self.total_episodes:
+            return
+        self.watched_episodes = self.total_episodes
+        series = self.series_content
+        if series and series.last_season_number is not None:
+            # Ultima temporada/episodio, desnormalizados en Series
+            self.current_season = series.last_season_number
+            self.current_episode = series.last_season_episode_count
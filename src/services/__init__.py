@@ -0,0 +1 @@
+"""Capa de servicios con la logica de negocio de cada recurso."""
@@ -0,0 +1,89 @@
+"""Logica de negocio para el recurso Movie."""
+
+from __future__ import annotations
+
+from sqlalchemy.exc import IntegrityError
+
+from src.extensions import db
+from src.models.movie import Movie
+from src.utils import decode_cursor, fetch_page, table_version
+
+# Campos permitidos para actualizacion
+_MOVIE_UPDATE_FIELDS = frozenset(("title", "genre", "release_year"))
+
+
+def list_movies_summary(limit: int, cursor: str | None = None) -> dict:
+    """Retorna una pagina con el resumen de peliculas ordenadas por titulo."""
+    # TODO: consultar la base de datos y serializar a una lista de dicts.
+    # Solo se leen columnas del indice ix_movies_title_cover (index-only scan)
+    # y se devuelven como tuplas, sin materializar objetos ORM
+    query = db.select(
+        Movie.id,
+        Movie.title,
+        Movie.genre,
+        Movie.release_year,
+    ).order_by(Movie.title, Movie.id)
+    if cursor:
+        # Paginacion por keyset sobre (title, id)
+        title, last_id = decode_cursor(cursor, str, int)
+        query = query.where(
+            db.or_(
+                Movie.title > title,
+                db.and_(Movie.title == title, Movie.id > last_id),
+            )
+        )
+    return fetch_page(query, limit, "title", "id")
+
+
+def catalogue_version() -> tuple:
+    """Devuelve (ultima modificacion, cantidad) del catalogo para el ETag."""
+    return table_version(Movie)
+
+
+def create_movie(payload: dict) -> dict:
+    """Crea una nueva pelicula."""
+    # TODO: validar el payload y persistir un nuevo registro Movie.
+    # Una validacion simple, se podria usar Marshmallow/Pydantic
+    if "title" not in payload:
+        raise ValueError("El campo 'title' es obligatorio.")
+
+    movie = Movie(**payload)
+    try:
+        # El bloque hace commit al salir y rollback ante cualquier error
+        with db.session.begin():
+            db.session.add(movie)
+    except IntegrityError:
+        raise ValueError("Error al guardar la pelicula.")
+    return movie.to_dict()
+
+
+def get_movie(movie_id: int) -> dict | None:
+    """Obtiene una pelicula por su identificador."""
+    # TODO: buscar la pelicula y manejar el caso de no encontrada.
+    movie = db.session.get(Movie, movie_id)
+    return movie.to_dict() if movie else None
+
+
+def update_movie(movie_id: int, payload: dict) -> dict | None:
+    """Actualiza los datos de una pelicula."""
+    # TODO: aplicar cambios permitidos y guardar en la base de datos.
+    with db.session.begin():
+        movie = db.session.get(Movie, movie_id)
+        if not movie:
+            return None
+
+        for key, value in payload.items():
+            if key in _MOVIE_UPDATE_FIELDS:
+                setattr(movie, key, value)
+    return movie.to_dict()
+
+
+def delete_movie(movie_id: int) -> bool:
+    """Elimina una pelicula existente."""
+    # TODO: definir si el borrado debe ser logico o fisico.
+    with db.session.begin():
+        movie = db.session.get(Movie, movie_id)
+        if not movie:
+            return False
+        db.session.delete(movie)
+    return True
@@ -0,0 +1,214 @@
+"""Logica de negocio para la watchlist y el progreso de los usuarios."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy.exc import IntegrityError
+
+from src.extensions import db
+from src.models.movie import Movie
+from src.models.series import Series
+from src.models.watch_entry import (
+    Status,
+    WatchEntry,
+    WatchMovieEntry,
+    WatchSeriesEntry,
+)
+from src.utils import decode_cursor, fetch_page
+
+_LIGHT_COLUMNS = tuple(
+    getattr(WatchEntry, field) for field in WatchEntry.__json_light_fields__
+)
+
+# Tope de las columnas SMALLINT de progreso
+_SMALLINT_MAX = 32767
+
+
+def list_watchlist(user_id: int, limit: int, cursor: str | None = None) -> dict:
+    """Devuelve una pagina de los contenidos asociados a un usuario."""
+    # TODO: consultar entradas filtradas por user_id y calcular porcentajes.
+    # Solo se leen las columnas de __json_light_fields__ y se devuelven como tuplas,
+    # sin materializar objetos ORM ni recorrer relaciones
+    query = (
+        db.select(*_LIGHT_COLUMNS)
+        .where(WatchEntry.user_id == user_id)
+        .order_by(WatchEntry.updated_at.desc(), WatchEntry.id.desc())
+    )
+    if cursor:
+        # Paginacion por keyset sobre (updated_at, id) en orden descendente
+        updated_at, last_id = decode_cursor(cursor, str, int)
+        try:
+            updated_at = datetime.fromisoformat(updated_at)
+        except ValueError:
+            raise ValueError("Cursor invalido.")
+        query = query.where(
+            db.or_(
+                WatchEntry.updated_at < updated_at,
+                db.and_(
+                    WatchEntry.updated_at == updated_at,
+                    WatchEntry.id < last_id,
+                ),
+            )
+        )
+    return fetch_page(query, limit, "updated_at", "id")
+
+
+def add_movie(user_id: int, movie_id: int) -> dict:
+    """Agrega una pelicula a la lista del usuario."""
+    # TODO: validar existencia del usuario y pelicula antes de crear el registro.
+    # La restriccion uq_user_content rechaza duplicados en el INSERT
+    try:
+        with db.session.begin():
+            movie = db.session.get(Movie, movie_id)
+            if not movie:
+                raise ValueError(f"Pelicula con id {movie_id} no encontrada.")
+
+            entry = _insert_entry(
+                WatchMovieEntry, WatchMovieEntry.initial_values(user_id, movie_id)
+            )
+    except IntegrityError as exc:
+        if not _is_duplicate_entry(exc):
+            raise
+        raise ValueError("Pelicula ya esta en la watchlist.")
+    return entry
+
+
+def add_series(user_id: int, series_id: int) -> dict:
+    """Agrega una serie a la lista del usuario."""
+    # TODO: crear WatchEntry inicial con temporadas/episodios en cero.
+    # La restriccion uq_user_content rechaza duplicados en el INSERT
+    try:
+        with db.session.begin():
+            # El total de episodios se mantiene desnormalizado en Series
+            total_ep = (
+                db.session.query(Series.total_episodes)
+                .filter_by(id=series_id)
+                .scalar()
+            )
+            if total_ep is None:
+                raise ValueError(f"Serie con id {series_id} no encontrada.")
+
+            entry = _insert_entry(
+                WatchSeriesEntry,
+                WatchSeriesEntry.initial_values(user_id, series_id, total_ep),
+            )
+    except IntegrityError as exc:
+        if not _is_duplicate_entry(exc):
+            raise
+        raise ValueError("Serie ya esta en la watchlist.")
+    return entry
+
+
+def _is_duplicate_entry(exc: IntegrityError) -> bool:
+    """Indica si el error viene de la restriccion unica uq_user_content.
+
+    Otras violaciones (FK de users, CHECK de progreso) no son duplicados.
+    """
+    # psycopg expone el nombre de la restriccion; SQLite solo el mensaje
+    diag = getattr(exc.orig, "diag", None)
+    constraint = getattr(diag, "constraint_name", None)
+    if constraint is not None:
+        return constraint == "uq_user_content"
+    message = str(exc.orig)
+    return "uq_user_content" in message or (
+        "UNIQUE constraint failed: watch_entries." in message
+    )
+
+
+def _insert_entry(model: type[WatchEntry], values: dict) -> dict:
+    """Inserta una entrada nueva con INSERT ... RETURNING, sin crear objetos ORM."""
+    row = db.session.execute(
+        db.insert(model)
+        .values(values)
+        .returning(
+            WatchEntry.id,
+            WatchEntry.user_id,
+            WatchEntry.content_type,
+            WatchEntry.content_id,
+            WatchEntry.status,
+            WatchEntry.current_season,
+            WatchEntry.current_episode,
+            WatchEntry.watched_episodes,
+            WatchEntry.total_episodes,
+            # SQLite devuelve la columna generada sin aplicar su tipo en RETURNING
+            db.cast(WatchEntry.percentage_watched, db.Float).label(
+                "percentage_watched"
+            ),
+            WatchEntry.updated_at,
+        )
+    ).one()
+    return row._asdict()
+
+
+def _position(payload: dict, field: str) -> int:
+    """Lee una temporada o episodio del payload dentro del rango de SMALLINT."""
+    try:
+        value = int(payload[field])
+    except (TypeError, ValueError):
+        raise ValueError(f"{field} debe ser un entero.")
+    if not 0 <= value <= _SMALLINT_MAX:
+        raise ValueError(f"{field} fuera de rango (0..{_SMALLINT_MAX}).")
+    return value
+
+
+def update_series_progress(user_id: int, series_id: int, payload: dict) -> dict:
+    """Actualiza el progreso de una serie en la lista del usuario."""
+    # TODO: validar limites de temporadas y episodios, recalcular porcentaje.
+    with db.session.begin():
+        # mark_as_watched necesita la serie (relacion lazy="raise"); la ultima
+        # temporada esta desnormalizada, asi que no se cargan las temporadas.
+        entry = (
+            WatchSeriesEntry.query.options(
+                db.undefer_group("progress_detail"),
+                db.selectinload(WatchSeriesEntry.series_content),
+            )
+            .filter_by(user_id=user_id, content_id=series_id)
+            .first()
+        )
+
+        if not entry:
+            raise ValueError("Entrada no encontrada en la watchlist.")
+
+        # Se trabaja sobre variables locales para evitar lecturas repetidas
+        total = entry.total_episodes or 0
+        watched = entry.watched_episodes or 0
+
+        # Campos actualizables
+        if "watched_episodes" in payload:
+            # Validar limites
+            watched = max(0, min(int(payload["watched_episodes"]), total))
+            entry.watched_episodes = watched
+
+        if "current_season" in payload:
+            entry.current_season = _position(payload, "current_season")
+
+        if "current_episode" in payload:
+            entry.current_episode = _position(payload, "current_episode")
+
+        # Recalcular estado basado en episodios, salvo que se marque como visto
+        previous_status = entry.status
+        status = previous_status
+        if "status" in payload:
+            try:
+                status = Status(payload["status"])
+            except ValueError:
+                raise ValueError("Estado invalido.")
+        if status is not Status.watched:
+            if total > 0 and watched >= total:
+                status = Status.watched
+            else:
+                status = Status.watching if watched > 0 else Status.pending
+
+        if status is Status.watched and (
+            previous_status is not Status.watched or "status" in payload
+        ):
+            entry.mark_as_watched()
+        else:
+            entry.status = status
+
+        # Se serializa antes del commit: tras el flush solo la columna generada
+        # queda expirada, asi se evita recargar la entrada y sus relaciones.
+        db.session.flush()
+        result = entry.to_dict()
+    return result
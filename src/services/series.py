@@ -0,0 +1,188 @@
+"""Logica de negocio para Series y Seasons."""
+
+from __future__ import annotations
+
+from sqlalchemy.exc import IntegrityError
+
+from src.extensions import db
+from src.models.seasons import Season
+from src.models.series import Series
+from src.utils import decode_cursor, fetch_page, table_version
+
+# Campos permitidos para actualizacion
+_SERIES_UPDATE_FIELDS = frozenset(
+    ("title", "total_seasons", "synopsis", "genres", "image_url")
+)
+# Columnas desnormalizadas que solo mantiene add_season: nunca vienen del cliente
+_SERIES_DERIVED_FIELDS = frozenset(
+    ("total_episodes", "last_season_number", "last_season_episode_count")
+)
+
+
+def list_series(limit: int, cursor: str | None = None) -> dict:
+    """Retorna una pagina de series ordenadas por titulo."""
+    # TODO: consultar las series existentes y devolverlas serializadas.
+    # No incluimos temporadas en el listado general por performance y se
+    # consultan solo las columnas como tuplas, sin materializar objetos ORM
+    query = db.select(
+        Series.id,
+        Series.title,
+        Series.total_seasons,
+        Series.synopsis,
+        Series.genres,
+        Series.image_url,
+        Series.created_at,
+        Series.updated_at,
+    ).order_by(Series.title, Series.id)
+    if cursor:
+        # Paginacion por keyset sobre (title, id)
+        title, last_id = decode_cursor(cursor, str, int)
+        query = query.where(
+            db.or_(
+                Series.title > title,
+                db.and_(Series.title == title, Series.id > last_id),
+            )
+        )
+    return fetch_page(query, limit, "title", "id")
+
+
+def catalogue_version() -> tuple:
+    """Devuelve (ultima modificacion, cantidad) del catalogo para el ETag."""
+    return table_version(Series)
+
+
+def create_series(payload: dict) -> dict:
+    """Crea una nueva serie."""
+    # TODO: validar payload (titulo, temporadas, etc.) y persistir la serie.
+    if "title" not in payload or "total_seasons" not in payload:
+        raise ValueError("Los campos 'title' y 'total_seasons' son obligatorios.")
+
+    series = Series(
+        **{
+            key: value
+            for key, value in payload.items()
+            if key not in _SERIES_DERIVED_FIELDS
+        }
+    )
+    try:
+        with db.session.begin():
+            db.session.add(series)
+    except IntegrityError:
+        raise ValueError("Error al guardar la serie.")
+    return series.to_dict()
+
+
+def get_series(series_id: int) -> dict | None:
+    """Obtiene una serie y sus temporadas asociadas."""
+    # TODO: recuperar el registro y manejar la ausencia del recurso.
+    # Las temporadas se cargan en una sola consulta adicional (selectin)
+    series = db.session.get(
+        Series, series_id, options=[db.selectinload(Series.seasons)]
+    )
+    return series.to_dict(include_seasons=True) if series else None
+
+
+def update_series(series_id: int, payload: dict) -> dict | None:
+    """Actualiza los campos permitidos de una serie."""
+    # TODO: definir que campos son editables e implementar la actualizacion.
+    with db.session.begin():
+        series = db.session.get(
+            Series, series_id, options=[db.selectinload(Series.seasons)]
+        )
+        if not series:
+            return None
+
+        for key, value in payload.items():
+            if key in _SERIES_UPDATE_FIELDS:
+                setattr(series, key, value)
+
+        # Se serializa antes del commit para aprovechar las temporadas ya
+        # cargadas; el commit expiraria la serie y forzaria recargarla.
+        db.session.flush()
+        result = series.to_dict(include_seasons=True)
+    return result
+
+
+def delete_series(series_id: int) -> bool:
+    """Elimina una serie del catalogo."""
+    # TODO: decidir estrategia de borrado e implementarla.
+    with db.session.begin():
+        series = db.session.get(Series, series_id)
+        if not series:
+            return False
+        # El borrado en cascada eliminara las temporadas asociadas
+        db.session.delete(series)
+    return True
+
+
+def add_season(series_id: int, payload: dict) -> dict:
+    """Agrega una temporada a una serie existente."""
+    # TODO: validar numero de temporada y cantidad de episodios.
+    with db.session.begin():
+        series = db.session.get(Series, series_id)
+        if not series:
+            raise ValueError(f"La serie con id {series_id} no existe.")
+
+        if "number" not in payload or "episodes_count" not in payload:
+            raise ValueError(
+                "Los campos 'number' y 'episodes_count' son obligatorios."
+            )
+
+        # Validar que no exista ya esa temporada
+        exists = db.session.query(
+            db.exists().where(
+                Season.series_id == series_id,
+                Season.number == payload["number"],
+            )
+        ).scalar()
+        if exists:
+            raise ValueError(
+                f"La temporada {payload['number']} ya existe para esta serie."
+            )
+
+        new_season = Season(series_id=series_id, **payload)
+        db.session.add(new_season)
+        # Incremento atomico en SQL del total desnormalizado de episodios
+        series.total_episodes = Series.total_episodes + new_season.episodes_count
+        # La ultima temporada solo cambia si la nueva tiene un numero mayor
+        is_last = db.or_(
+            Series.last_season_number.is_(None),
+            Series.last_season_number < new_season.number,
+        )
+        series.last_season_number = db.case(
+            (is_last, new_season.number), else_=Series.last_season_number
+        )
+        series.last_season_episode_count = db.case(
+            (is_last, new_season.episodes_count),
+            else_=Series.last_season_episode_count,
+        )
+    return new_season.to_dict()
+
+
+def backfill_totals() -> int:
+    """Recalcula desde las temporadas los campos desnormalizados de Series.
+
+    Pensado para correr una vez tras agregar las columnas a una base con datos.
+    Devuelve la cantidad de series actualizadas.
+    """
+    seasons = db.select(Season).where(Season.series_id == Series.id)
+    total_episodes = seasons.with_only_columns(
+        db.func.coalesce(db.func.sum(Season.episodes_count), 0)
+    ).scalar_subquery()
+    # Temporada de numero mas alto; queda NULL si la serie no tiene temporadas
+    last_season = seasons.order_by(Season.number.desc()).limit(1)
+    with db.session.begin():
+        result = db.session.execute(
+            db.update(Series)
+            .values(
+                total_episodes=total_episodes,
+                last_season_number=last_season.with_only_columns(
+                    Season.number
+                ).scalar_subquery(),
+                last_season_episode_count=last_season.with_only_columns(
+                    Season.episodes_count
+                ).scalar_subquery(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+    return result.rowcount
@@ -0,0 +1,20 @@
+"""Utilidades compartidas por la API."""
+
+from .etag import cached_list, make_etag, table_version
+from .orjson_provider import ORJSONProvider
+from .orjson_response import ORJSON_OPTIONS, ORJSONResponse, dumps
+from .pagination import decode_cursor, encode_cursor, fetch_page, get_page_args
+
+__all__ = [
+    "ORJSON_OPTIONS",
+    "ORJSONProvider",
+    "ORJSONResponse",
+    "cached_list",
+    "decode_cursor",
+    "dumps",
+    "encode_cursor",
+    "fetch_page",
+    "get_page_args",
+    "make_etag",
+    "table_version",
+]
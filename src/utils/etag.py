@@ -0,0 +1,59 @@
+"""Helpers para respuestas condicionales basadas en ETag."""
+
+from __future__ import annotations
+
+import hashlib
+from functools import lru_cache
+from typing import Any, Callable
+
+from flask import request
+
+from src.extensions import db
+
+from .orjson_response import ORJSONResponse, dumps
+from .pagination import get_page_args
+
+
+def make_etag(*parts: Any) -> str:
+    """Genera un ETag corto a partir de los valores que identifican la respuesta."""
+    return hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest()
+
+
+def table_version(model: Any) -> tuple:
+    """Devuelve (ultima modificacion, cantidad) de ``model`` para el ETag.
+
+    Ambos agregados se resuelven con el indice sobre ``updated_at`` del modelo.
+    """
+    return tuple(
+        db.session.execute(
+            db.select(db.func.max(model.updated_at), db.func.count(model.id))
+        ).one()
+    )
+
+
+def cached_list(
+    version: Callable[[], tuple], list_page: Callable[[int, str | None], dict]
+) -> Callable[[], ORJSONResponse]:
+    """Arma la vista de un listado paginado con ETag debil y cache de paginas.
+
+    ``version`` identifica el estado del catalogo y ``list_page(limit, cursor)``
+    devuelve la pagina. Un ``If-None-Match`` vigente responde 304 sin leer la
+    pagina; si no, el cuerpo serializado sale de una cache LRU cuya clave
+    incluye el ETag, asi que cualquier cambio del catalogo la invalida.
+    """
+
+    @lru_cache(maxsize=128)
+    def page_body(etag: str, limit: int, cursor: str | None) -> bytes:
+        return dumps(list_page(limit, cursor))
+
+    def respond() -> ORJSONResponse:
+        limit, cursor = get_page_args()
+        etag = make_etag(*version(), limit, cursor)
+        if request.if_none_match.contains_weak(etag):
+            response = ORJSONResponse(status=304)
+        else:
+            response = ORJSONResponse(page_body(etag, limit, cursor), status=200)
+        response.set_etag(etag, weak=True)
+        return response
+
+    return respond
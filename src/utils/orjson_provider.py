@@ -0,0 +1,44 @@
+"""Proveedor JSON de Flask basado en orjson."""
+
+from __future__ import annotations
+
+import decimal
+from typing import Any
+
+import orjson
+from flask import Response
+from flask.json.provider import JSONProvider
+
+from .orjson_response import ORJSON_OPTIONS
+
+
+def _default(obj: Any) -> Any:
+    """Convierte los tipos que orjson no soporta, igual que el proveedor de Flask."""
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class ORJSONProvider(JSONProvider):
+    """Reemplaza ``app.json`` para que jsonify, los errores y get_json usen orjson."""
+
+    @staticmethod
+    def _dumps_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serializa ``obj`` a texto JSON."""
+        return self._dumps_bytes(obj).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserializa texto o bytes JSON."""
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Construye la respuesta directo desde los bytes, sin pasar por str."""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            self._dumps_bytes(obj), mimetype="application/json"
+        )
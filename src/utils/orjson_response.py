@@ -0,0 +1,28 @@
+"""Respuesta JSON serializada con orjson."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from flask import Response
+
+# Opciones compartidas por todas las serializaciones de la API.
+# orjson serializa datetime de forma nativa (ISO 8601); los naive se tratan como UTC.
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC
+
+
+def dumps(data: Any) -> bytes:
+    """Serializa ``data`` a bytes JSON con orjson."""
+    return orjson.dumps(data, option=ORJSON_OPTIONS)
+
+
+class ORJSONResponse(Response):
+    """Respuesta Flask que serializa el cuerpo con orjson en lugar de json."""
+
+    default_mimetype = "application/json"
+
+    @classmethod
+    def make(cls, data: Any, status: int = 200) -> ORJSONResponse:
+        """Serializa ``data`` y construye la respuesta con el status indicado."""
+        return cls(dumps(data), status=status, mimetype="application/json")
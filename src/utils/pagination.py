@@ -0,0 +1,60 @@
+"""Helpers para paginar listados mediante cursores (keyset pagination)."""
+
+from __future__ import annotations
+
+import base64
+from typing import Any
+
+import orjson
+from flask import request
+
+from src.extensions import db
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+
+def get_page_args() -> tuple[int, str | None]:
+    """Lee ``limit`` y ``cursor`` de la query string de la peticion actual."""
+    limit = request.args.get("limit", default=DEFAULT_PAGE_SIZE, type=int)
+    return max(1, min(limit, MAX_PAGE_SIZE)), request.args.get("cursor")
+
+
+def encode_cursor(*values: Any) -> str:
+    """Codifica la clave de orden del ultimo elemento como un cursor opaco."""
+    return base64.urlsafe_b64encode(orjson.dumps(values)).decode()
+
+
+def decode_cursor(cursor: str, *types: type) -> list:
+    """Decodifica un cursor generado por ``encode_cursor``.
+
+    ``types`` indica el tipo esperado de cada valor; un cursor con otra forma
+    se rechaza aqui y no llega a la comparacion en SQL.
+    """
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:
+        raise ValueError("Cursor invalido.")
+    if not isinstance(values, list) or len(values) != len(types):
+        raise ValueError("Cursor invalido.")
+    for value, expected in zip(values, types):
+        # bool es subclase de int: se descarta explicitamente
+        if not isinstance(value, expected) or isinstance(value, bool):
+            raise ValueError("Cursor invalido.")
+    return values
+
+
+def fetch_page(query: Any, limit: int, *key_fields: str) -> dict:
+    """Ejecuta ``query`` y arma la pagina ``{"items", "next_cursor"}``.
+
+    ``key_fields`` son las columnas de la clave de orden que se codifican en
+    el cursor a partir del ultimo elemento de la pagina.
+    """
+    # Se pide una fila extra para saber si existe una pagina siguiente
+    rows = db.session.execute(query.limit(limit + 1)).all()
+    items = [row._asdict() for row in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(*(last[field] for field in key_fields))
+    return {"items": items, "next_cursor": next_cursor}
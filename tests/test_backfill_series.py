@@ -0,0 +1,119 @@
+"""Pruebas del comando flask backfill-series."""
+
+import unittest
+
+from src import create_app
+from src.config import TestingConfig
+from src.extensions import db
+from src.models import Season, Series
+from src.services import series as series_service
+
+
+class BackfillSeriesTest(unittest.TestCase):
+    """Recalcula los totales de series cargadas antes de desnormalizarlos."""
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        with self.app.app_context():
+            db.create_all()
+            series = Series(title="Dark")
+            db.session.add_all([series, Series(title="Sin temporadas")])
+            db.session.flush()
+            # Temporadas insertadas directo, sin pasar por add_season
+            db.session.add_all(
+                [
+                    Season(series_id=series.id, number=2, episodes_count=8),
+                    Season(series_id=series.id, number=1, episodes_count=10),
+                ]
+            )
+            db.session.commit()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.drop_all()
+
+    def test_recomputes_totals_and_last_season(self):
+        result = self.app.test_cli_runner().invoke(args=["backfill-series"])
+        self.assertIsNone(result.exception)
+        self.assertIn("Series actualizadas: 2", result.output)
+
+        with self.app.app_context():
+            rows = {
+                title: rest
+                for title, *rest in db.session.execute(
+                    db.select(
+                        Series.title,
+                        Series.total_episodes,
+                        Series.last_season_number,
+                        Series.last_season_episode_count,
+                    )
+                )
+            }
+        self.assertEqual(rows, {"Dark": [18, 2, 8], "Sin temporadas": [0, None, None]})
+
+
+class AddSeasonMatchesBackfillTest(unittest.TestCase):
+    """add_season y backfill_totals deben dejar los mismos valores."""
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        with self.app.app_context():
+            db.create_all()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.drop_all()
+
+    def _denormalized(self) -> dict:
+        with self.app.app_context():
+            return {
+                title: tuple(rest)
+                for title, *rest in db.session.execute(
+                    db.select(
+                        Series.title,
+                        Series.total_episodes,
+                        Series.last_season_number,
+                        Series.last_season_episode_count,
+                    )
+                )
+            }
+
+    def test_add_season_and_backfill_agree(self):
+        seasons_by_title = {
+            # Temporada 0 (especiales) como unica temporada
+            "Especiales": [(0, 5)],
+            "Desordenada": [(2, 8), (0, 3), (1, 10)],
+        }
+        client = self.app.test_client()
+        for title, seasons in seasons_by_title.items():
+            series = client.post(
+                "/series/", json={"title": title, "total_seasons": len(seasons)}
+            ).get_json()
+            for number, episodes in seasons:
+                response = client.post(
+                    f"/series/{series['id']}/seasons",
+                    json={"number": number, "episodes_count": episodes},
+                )
+                self.assertEqual(response.status_code, 201)
+
+        incremental = self._denormalized()
+        self.assertEqual(
+            incremental, {"Especiales": (5, 0, 5), "Desordenada": (21, 2, 8)}
+        )
+
+        # Se borran los valores y se recalculan desde las temporadas
+        with self.app.app_context():
+            with db.session.begin():
+                db.session.execute(
+                    db.update(Series).values(
+                        total_episodes=0,
+                        last_season_number=None,
+                        last_season_episode_count=None,
+                    )
+                )
+            series_service.backfill_totals()
+        self.assertEqual(self._denormalized(), incremental)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+"""Pruebas de la actualizacion de progreso de series."""
+
+import unittest
+
+from src import create_app
+from src.config import TestingConfig
+from src.extensions import db
+from src.models import Series, User
+
+
+class UpdateSeriesProgressTest(unittest.TestCase):
+    """La posicion actual debe caber en las columnas SMALLINT."""
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        with self.app.app_context():
+            db.create_all()
+            db.session.add_all([User(id=1, name="ana"), Series(id=1, title="Dark")])
+            db.session.commit()
+        self.client = self.app.test_client()
+        self.headers = {"X-User-Id": "1"}
+        response = self.client.post("/watchlist/series/1", headers=self.headers)
+        self.assertEqual(response.status_code, 201)
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.drop_all()
+
+    def test_out_of_range_position_is_rejected(self):
+        for payload in (
+            {"current_season": 32768},
+            {"current_episode": -1},
+            {"current_season": None},
+            {"current_episode": "x"},
+        ):
+            with self.subTest(payload=payload):
+                response = self.client.patch(
+                    "/progress/series/1", headers=self.headers, json=payload
+                )
+                self.assertEqual(response.status_code, 400)
+
+        response = self.client.patch(
+            "/progress/series/1",
+            headers=self.headers,
+            json={"current_season": 32767, "current_episode": 0},
+        )
+        self.assertEqual(response.status_code, 200)
+        body = response.get_json()
+        self.assertEqual((body["current_season"], body["current_episode"]), (32767, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
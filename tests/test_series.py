@@ -0,0 +1,49 @@
+"""Pruebas del servicio de series y temporadas."""
+
+import unittest
+
+from src import create_app
+from src.config import TestingConfig
+from src.extensions import db
+from src.models import Series
+
+
+class CreateSeriesTest(unittest.TestCase):
+    """El alta de series no acepta columnas desnormalizadas del cliente."""
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        with self.app.app_context():
+            db.create_all()
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.drop_all()
+
+    def test_derived_columns_in_payload_are_ignored(self):
+        response = self.client.post(
+            "/series/",
+            json={
+                "title": "Y",
+                "total_seasons": 1,
+                "total_episodes": 999,
+                "last_season_number": 7,
+                "last_season_episode_count": 3,
+            },
+        )
+        self.assertEqual(response.status_code, 201)
+
+        with self.app.app_context():
+            row = db.session.execute(
+                db.select(
+                    Series.total_episodes,
+                    Series.last_season_number,
+                    Series.last_season_episode_count,
+                )
+            ).one()
+        self.assertEqual(tuple(row), (0, None, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,203 @@
+"""Pruebas del modelo WatchEntry: helpers y serializacion."""
+
+import unittest
+
+from src import create_app
+from src.config import TestingConfig
+from src.extensions import db
+from src.models import (
+    ContentType,
+    Movie,
+    Series,
+    Status,
+    User,
+    WatchEntry,
+    WatchMovieEntry,
+    WatchSeriesEntry,
+)
+
+
+class BulkMarkWatchedTest(unittest.TestCase):
+    """bulk_mark_watched debe dejar lo mismo que mark_as_watched."""
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        with self.app.app_context():
+            db.create_all()
+            db.session.add_all(
+                [
+                    User(id=1, name="ana"),
+                    User(id=2, name="beto"),
+                    Movie(id=1, title="Arrival"),
+                    Series(id=1, title="Dark", total_seasons=2),
+                    Series(id=2, title="Sin temporadas"),
+                ]
+            )
+            db.session.commit()
+        self.client = self.app.test_client()
+        # Las temporadas pasan por add_season para desnormalizar los totales
+        for number, episodes in ((2, 7), (1, 4)):
+            response = self.client.post(
+                "/series/1/seasons",
+                json={"number": number, "episodes_count": episodes},
+            )
+            self.assertEqual(response.status_code, 201)
+        for user_id in ("1", "2"):
+            headers = {"X-User-Id": user_id}
+            for path in (
+                "/watchlist/movies/1",
+                "/watchlist/series/1",
+                "/watchlist/series/2",
+            ):
+                response = self.client.post(path, headers=headers)
+                self.assertEqual(response.status_code, 201)
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.drop_all()
+
+    def _progress(self, user_id: int) -> dict:
+        with self.app.app_context():
+            return {
+                (content_type, content_id): tuple(rest)
+                for content_type, content_id, *rest in db.session.execute(
+                    db.select(
+                        WatchEntry.content_type,
+                        WatchEntry.content_id,
+                        WatchEntry.status,
+                        WatchEntry.watched_episodes,
+                        WatchEntry.total_episodes,
+                        WatchEntry.current_season,
+                        WatchEntry.current_episode,
+                        WatchEntry.percentage_watched,
+                    ).where(WatchEntry.user_id == user_id)
+                )
+            }
+
+    def test_matches_mark_as_watched(self):
+        with self.app.app_context():
+            with db.session.begin():
+                entry_ids = db.session.scalars(
+                    db.select(WatchEntry.id).where(WatchEntry.user_id == 1)
+                ).all()
+                updated = WatchEntry.bulk_mark_watched(1, entry_ids)
+            self.assertEqual(updated, 3)
+
+            with db.session.begin():
+                entries = [
+                    *WatchMovieEntry.query.filter_by(user_id=2),
+                    *WatchSeriesEntry.query.options(
+                        db.undefer_group("progress_detail"),
+                        db.selectinload(WatchSeriesEntry.series_content),
+                    ).filter_by(user_id=2),
+                ]
+                for entry in entries:
+                    entry.mark_as_watched()
+
+        bulk = self._progress(1)
+        self.assertEqual(
+            bulk,
+            {
+                ("movie", 1): ("watched", 1, 1, 1, 1, 100.0),
+                ("series", 1): ("watched", 11, 11, 2, 7, 100.0),
+                # Sin episodios no hay ultima temporada: la posicion no cambia
+                ("series", 2): ("watched", 0, 0, 1, 1, 100.0),
+            },
+        )
+        self.assertEqual(bulk, self._progress(2))
+
+
+
+class ToDictTest(unittest.TestCase):
+    """to_dict devuelve lo mismo con la entrada recien cargada o expirada."""
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        with self.app.app_context():
+            db.create_all()
+            db.session.add_all(
+                [
+                    User(id=1, name="ana"),
+                    Movie(id=1, title="Arrival"),
+                    Series(id=1, title="Dark"),
+                ]
+            )
+            db.session.flush()
+            watched = WatchSeriesEntry.initial_values(
+                user_id=1, content_id=1, total_episodes=10
+            )
+            watched.update(
+                status=Status.watched,
+                watched_episodes=10,
+                current_season=2,
+                current_episode=5,
+            )
+            db.session.add_all(
+                [
+                    WatchMovieEntry(
+                        id=1, **WatchMovieEntry.initial_values(user_id=1, content_id=1)
+                    ),
+                    WatchSeriesEntry(id=2, **watched),
+                ]
+            )
+            db.session.commit()
+            updated_at = dict(
+                db.session.execute(
+                    db.select(WatchEntry.id, WatchEntry.updated_at)
+                ).all()
+            )
+        self.expected = {
+            1: {
+                "id": 1,
+                "user_id": 1,
+                "content_type": ContentType.movie,
+                "content_id": 1,
+                "status": Status.pending,
+                "current_season": 1,
+                "current_episode": 1,
+                "watched_episodes": 0,
+                "total_episodes": 1,
+                "percentage_watched": 0.0,
+                "updated_at": updated_at[1],
+            },
+            2: {
+                "id": 2,
+                "user_id": 1,
+                "content_type": ContentType.series,
+                "content_id": 1,
+                "status": Status.watched,
+                "current_season": 2,
+                "current_episode": 5,
+                "watched_episodes": 10,
+                "total_episodes": 10,
+                "percentage_watched": 100.0,
+                "updated_at": updated_at[2],
+            },
+        }
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.drop_all()
+
+    def test_fresh_and_expired_entries(self):
+        for entry_id, expected in self.expected.items():
+            with self.subTest(entry_id=entry_id), self.app.app_context():
+                # Recien cargada: las columnas diferidas se leen al acceder
+                entry = db.session.get(WatchEntry, entry_id)
+                self.assertEqual(entry.to_dict(), expected)
+                # Tras el commit todas las columnas quedan expiradas
+                db.session.commit()
+                self.assertNotIn("status", entry.__dict__)
+                self.assertEqual(entry.to_dict(), expected)
+
+    def test_generated_function_names(self):
+        self.assertEqual(WatchEntry.to_dict.__qualname__, "WatchEntry.to_dict")
+        self.assertEqual(WatchEntry.to_dict.__module__, "src.models.watch_entry")
+        self.assertEqual(
+            WatchEntry.to_dict.__code__.co_filename,
+            "<src.models.watch_entry.WatchEntry.to_dict>",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""Pruebas de la paginacion por cursor de /me/watchlist."""
+
+import unittest
+
+from src import create_app
+from src.utils import encode_cursor
+from src.config import TestingConfig
+from src.extensions import db
+from src.models import Movie, User
+
+
+class WatchlistPaginationTest(unittest.TestCase):
+    """Recorre la watchlist pagina a pagina sobre SQLite."""
+
+    def setUp(self):
+        self.app = create_app(TestingConfig)
+        with self.app.app_context():
+            db.create_all()
+            db.session.add(User(id=1, name="ana"))
+            db.session.add_all(Movie(title=f"Pelicula {i}") for i in range(1, 4))
+            db.session.commit()
+        self.client = self.app.test_client()
+        self.headers = {"X-User-Id": "1"}
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.drop_all()
+
+    def test_walk_with_limit_one_visits_each_entry_once(self):
+        for movie_id in (1, 2, 3):
+            response = self.client.post(
+                f"/watchlist/movies/{movie_id}", headers=self.headers
+            )
+            self.assertEqual(response.status_code, 201)
+
+        seen = []
+        cursor = None
+        # Tope de vueltas para que un cursor que no avanza no cuelgue la prueba
+        for _ in range(10):
+            query = {"limit": 1}
+            if cursor:
+                query["cursor"] = cursor
+            response = self.client.get(
+                "/me/watchlist", headers=self.headers, query_string=query
+            )
+            self.assertEqual(response.status_code, 200)
+            body = response.get_json()
+            seen.extend(item["id"] for item in body["items"])
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+
+        self.assertEqual(seen, [3, 2, 1])
+
+    def test_cursor_with_wrong_value_types_is_rejected(self):
+        for cursor in (encode_cursor(1, "abc"), encode_cursor("2024-01-01", True)):
+            response = self.client.get(
+                "/me/watchlist", headers=self.headers, query_string={"cursor": cursor}
+            )
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.get_json(), {"error": "Cursor invalido."})
+
+
+if __name__ == "__main__":
+    unittest.main()